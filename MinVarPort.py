@@ -1,6 +1,8 @@
 import streamlit as st
 import numpy as np
-import matplotlib.pyplot as plt
+import plotly.graph_objects as go
+
+from portfolio_core import tangency_closed_form, complete_portfolio, efficient_frontier
 
 st.title("🎯 Portfolio Optimizer")
 
@@ -20,48 +22,24 @@ r_free = st.sidebar.number_input("Risk-Free Rate (%)", value=2.0) / 100
 st.sidebar.header("Your Preferences")
 gamma = st.sidebar.slider("Risk Aversion (γ)", min_value=0.1, max_value=10.0, value=5.0, step=0.1)
 
-# Functions
-def portfolio_ret(w1, r1, r2):
-    return w1 * r1 + (1 - w1) * r2
-
-def portfolio_sd(w1, sd1, sd2, rho):
-    return np.sqrt(w1**2 * sd1**2 + (1-w1)**2 * sd2**2 + 2 * rho * w1 * (1-w1) * sd1 * sd2)
-
 # Find tangency portfolio
-weights = np.linspace(0, 1, 1000)
-sharpe_ratios = []
-
-for w in weights:
-    ret = portfolio_ret(w, r_h, r_f)
-    sd = portfolio_sd(w, sd_h, sd_f, rho_hf)
-    if sd > 0:
-        sharpe = (ret - r_free) / sd
-        sharpe_ratios.append(sharpe)
-    else:
-        sharpe_ratios.append(-np.inf)
-
-max_idx = np.argmax(sharpe_ratios)
-w1_tangency = weights[max_idx]
+w1_tangency, sharpe_tangency, ret_tangency, sd_tangency = tangency_closed_form(r_h, r_f, sd_h, sd_f, rho_hf, r_free)
 w2_tangency = 1 - w1_tangency
 
-ret_tangency = portfolio_ret(w1_tangency, r_h, r_f)
-sd_tangency = portfolio_sd(w1_tangency, sd_h, sd_f, rho_hf)
+if sharpe_tangency == np.inf:
+    st.warning("With a correlation of -1 the two assets combine into a riskless "
+               "portfolio that beats the risk-free rate, so no tangency portfolio "
+               "exists. Choose a correlation above -1.")
+    st.stop()
 
 # Find optimal portfolio
-if sd_tangency > 0:
-    w_tangency_optimal = (ret_tangency - r_free) / (gamma * sd_tangency**2)
-else:
-    w_tangency_optimal = 0
+w_tangency_optimal, ret_optimal, sd_optimal = complete_portfolio(ret_tangency, sd_tangency, r_free, gamma)
 
 # Complete portfolio weights
 w1_optimal = w_tangency_optimal * w1_tangency
 w2_optimal = w_tangency_optimal * w2_tangency
 w_rf_optimal = 1 - w_tangency_optimal
 
-# Optimal portfolio characteristics
-ret_optimal = r_free + w_tangency_optimal * (ret_tangency - r_free)
-sd_optimal = abs(w_tangency_optimal) * sd_tangency
-
 # Display results
 tab1, tab2 = st.tabs(["📊 Results", "📈 Graph"])
 
@@ -82,35 +60,38 @@ with tab2:
     st.header("Portfolio Visualization")
     
     # Generate efficient frontier
-    weights_plot = np.linspace(0, 1, 200)
-    returns_frontier = [portfolio_ret(w, r_h, r_f) for w in weights_plot]
-    sds_frontier = [portfolio_sd(w, sd_h, sd_f, rho_hf) for w in weights_plot]
+    sds_frontier, returns_frontier = efficient_frontier(r_h, r_f, sd_h, sd_f, rho_hf, 200)
     
     # Create plot
-    fig, ax = plt.subplots(figsize=(10, 6))
+    fig = go.Figure()
     
     # Efficient frontier
-    ax.plot(sds_frontier, returns_frontier, 'b-', linewidth=2, label='Efficient Frontier')
+    fig.add_trace(go.Scatter(x=sds_frontier, y=returns_frontier, mode='lines',
+                             line=dict(color='blue', width=2), name='Efficient Frontier'))
     
     # Capital Market Line
-    sd_max = max(sds_frontier) * 1.2
-    sd_cml = np.linspace(0, sd_max, 100)
-    ret_cml = r_free + (ret_tangency - r_free) / sd_tangency * sd_cml if sd_tangency > 0 else r_free * np.ones_like(sd_cml)
-    ax.plot(sd_cml, ret_cml, 'g--', linewidth=2, label='Capital Market Line')
+    sd_max = sds_frontier.max() * 1.2
+    cml_slope = (ret_tangency - r_free) / sd_tangency if sd_tangency > 0 else 0
+    sd_cml = [0, sd_max]
+    ret_cml = [r_free, r_free + cml_slope * sd_max]
+    fig.add_trace(go.Scatter(x=sd_cml, y=ret_cml, mode='lines',
+                             line=dict(color='green', width=2, dash='dash'), name='Capital Market Line'))
     
     # Tangency portfolio
-    ax.scatter(sd_tangency, ret_tangency, color='red', s=200, zorder=5, marker='*', label='Tangency Portfolio')
+    fig.add_trace(go.Scatter(x=[sd_tangency], y=[ret_tangency], mode='markers',
+                             marker=dict(color='red', size=18, symbol='star'), name='Tangency Portfolio'))
     
     # Optimal portfolio
-    ax.scatter(sd_optimal, ret_optimal, color='orange', s=200, zorder=5, marker='D', label='Your Optimal Portfolio')
+    fig.add_trace(go.Scatter(x=[sd_optimal], y=[ret_optimal], mode='markers',
+                             marker=dict(color='orange', size=14, symbol='diamond'), name='Your Optimal Portfolio'))
     
     # Risk-free asset
-    ax.scatter(0, r_free, color='green', s=150, zorder=5, marker='s', label='Risk-Free Asset')
+    fig.add_trace(go.Scatter(x=[0], y=[r_free], mode='markers',
+                             marker=dict(color='green', size=12, symbol='square'), name='Risk-Free Asset'))
     
-    ax.set_xlabel('Risk (Standard Deviation)')
-    ax.set_ylabel('Expected Return')
-    ax.set_title('Portfolio Optimization')
-    ax.legend()
-    ax.grid(True, alpha=0.3)
+    fig.update_layout(title='Portfolio Optimization',
+                      xaxis_title='Risk (Standard Deviation)',
+                      yaxis_title='Expected Return',
+                      height=600)
     
-    st.pyplot(fig)
+    st.plotly_chart(fig)
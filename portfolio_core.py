@@ -0,0 +1,58 @@
+import streamlit as st
+import numpy as np
+
+def portfolio_ret(w1, r1, r2):
+    return w1 * r1 + (1 - w1) * r2
+
+def portfolio_sd(w1, v1, v2, c12):
+    # v1, v2 are the asset variances and c12 = 2 * rho * sd1 * sd2
+    w2 = 1 - w1
+    return np.sqrt(w1 * w1 * v1 + w2 * w2 * v2 + w1 * w2 * c12)
+
+@st.cache_data
+def tangency_closed_form(r1, r2, sd1, sd2, rho, rf):
+    # Closed-form two-asset tangency weight, clipped to [0, 1]. The interior
+    # solution is compared against the endpoints so the long-only boundary
+    # cases (and a zero denominator) behave like a grid search over [0, 1].
+    e1 = r1 - rf
+    e2 = r2 - rf
+    v1, v2, cov = sd1**2, sd2**2, rho * sd1 * sd2
+    if rho == -1 and e1 * sd2 + e2 * sd1 > 0:
+        # Perfect hedge that beats the risk-free rate: the riskless
+        # combination has an unbounded Sharpe ratio (an arbitrage).
+        w1 = sd2 / (sd1 + sd2)
+        return w1, np.inf, portfolio_ret(w1, r1, r2), 0.0
+
+    denom = e1 * v2 + e2 * v1 - (e1 + e2) * cov
+    candidates = [0.0, 1.0]
+    if denom != 0:
+        candidates.append(np.clip((e1 * v2 - e2 * cov) / denom, 0, 1))
+
+    weights = np.array(candidates)
+    rets = portfolio_ret(weights, r1, r2)
+    sds = portfolio_sd(weights, v1, v2, 2 * cov)
+    degenerate = ~(sds > 0)
+    sharpe_ratios = (rets - rf) / np.where(degenerate, 1.0, sds)
+    sharpe_ratios[degenerate] = -np.inf
+
+    max_idx = np.argmax(sharpe_ratios)
+    return weights[max_idx], sharpe_ratios[max_idx], rets[max_idx], sds[max_idx]
+
+def complete_portfolio(ret_t, sd_t, rf, gamma):
+    # Share of wealth in the tangency portfolio for a mean-variance investor
+    if sd_t > 0:
+        w_t = (ret_t - rf) / (gamma * sd_t**2)
+    else:
+        w_t = 0
+
+    ret = rf + w_t * (ret_t - rf)
+    sd = abs(w_t) * sd_t
+    return w_t, ret, sd
+
+@st.cache_data
+def efficient_frontier(r1, r2, sd1, sd2, rho, n):
+    v1, v2, cov = sd1**2, sd2**2, rho * sd1 * sd2
+    weights = np.linspace(0, 1, n, dtype=np.float32)
+    returns_frontier = portfolio_ret(weights, r1, r2)
+    sds_frontier = portfolio_sd(weights, v1, v2, 2 * cov)
+    return sds_frontier, returns_frontier
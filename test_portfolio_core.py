@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+
+from portfolio_core import portfolio_ret, portfolio_sd, tangency_closed_form
+
+def grid_tangency(r1, r2, sd1, sd2, rho, rf, n=200001):
+    # Brute-force reference: best Sharpe ratio over a fine long-only grid
+    weights = np.linspace(0, 1, n)
+    rets = portfolio_ret(weights, r1, r2)
+    sds = portfolio_sd(weights, sd1**2, sd2**2, 2 * rho * sd1 * sd2)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        sharpes = np.where(sds > 0, (rets - rf) / sds, -np.inf)
+    max_idx = np.argmax(sharpes)
+    return weights[max_idx], sharpes[max_idx]
+
+@pytest.mark.parametrize("seed", range(25))
+def test_matches_grid_on_random_inputs(seed):
+    rng = np.random.default_rng(seed)
+    r1, r2 = rng.uniform(-0.05, 0.2, 2)
+    sd1, sd2 = rng.uniform(0.02, 0.4, 2)
+    rho = rng.uniform(-0.95, 0.95)
+    rf = rng.uniform(0, 0.05)
+
+    w1, sharpe, ret, sd = tangency_closed_form(r1, r2, sd1, sd2, rho, rf)
+    w_grid, sharpe_grid = grid_tangency(r1, r2, sd1, sd2, rho, rf)
+
+    assert 0 <= w1 <= 1
+    assert sharpe >= sharpe_grid - 1e-9
+    assert sharpe == pytest.approx(sharpe_grid, abs=1e-6)
+    assert w1 == pytest.approx(w_grid, abs=1e-3)
+    assert ret == pytest.approx(portfolio_ret(w1, r1, r2))
+    assert sd == pytest.approx(portfolio_sd(w1, sd1**2, sd2**2, 2 * rho * sd1 * sd2))
+
+def test_zero_denominator_picks_best_endpoint():
+    # rho = 1 with equal volatilities makes the closed-form denominator zero
+    w1, sharpe, ret, sd = tangency_closed_form(0.05, 0.12, 0.2, 0.2, 1.0, 0.02)
+
+    assert w1 == 0
+    assert sharpe == pytest.approx(0.5)
+    assert sd == pytest.approx(0.2)
+
+def test_perfect_hedge_beating_risk_free_is_arbitrage():
+    w1, sharpe, ret, sd = tangency_closed_form(0.05, 0.12, 0.09, 0.2, -1.0, 0.02)
+
+    assert sharpe == np.inf
+    assert sd == 0
+    assert w1 == pytest.approx(0.2 / 0.29)
+    assert ret > 0.02
+
+def test_perfect_hedge_below_risk_free_uses_endpoints():
+    r1, r2, sd1, sd2, rf = 0.01, 0.04, 0.3, 0.2, 0.03
+    w1, sharpe, ret, sd = tangency_closed_form(r1, r2, sd1, sd2, -1.0, rf)
+    w_grid, sharpe_grid = grid_tangency(r1, r2, sd1, sd2, -1.0, rf)
+
+    assert np.isfinite(sharpe)
+    assert sd > 0
+    assert w1 == w_grid
+    assert sharpe == pytest.approx(sharpe_grid)
+
+@pytest.mark.parametrize("seed", range(25))
+def test_perfect_hedge_never_returns_nan(seed):
+    rng = np.random.default_rng(seed)
+    r1, r2 = rng.uniform(-0.05, 0.2, 2)
+    sd1, sd2 = rng.uniform(0.02, 0.4, 2)
+    rf = rng.uniform(0, 0.05)
+
+    w1, sharpe, ret, sd = tangency_closed_form(r1, r2, sd1, sd2, -1.0, rf)
+
+    assert not np.isnan([w1, sharpe, ret, sd]).any()
+    if sharpe != np.inf:
+        assert sd > 0
+
+def test_negative_excess_returns():
+    r1, r2, sd1, sd2, rho, rf = 0.01, 0.015, 0.09, 0.2, 0.3, 0.03
+    w1, sharpe, ret, sd = tangency_closed_form(r1, r2, sd1, sd2, rho, rf)
+    w_grid, sharpe_grid = grid_tangency(r1, r2, sd1, sd2, rho, rf)
+
+    assert sharpe < 0
+    assert sharpe >= sharpe_grid - 1e-9
+    assert w1 == pytest.approx(w_grid, abs=1e-3)